@@ -72,8 +72,6 @@ Functions list
 Functions doc
 --------------
 """
-import copy
-import logging
 import os.path
 from collections.abc import Mapping
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
@@ -83,8 +81,6 @@ from .platform import page as platform_setting
 from .session import get_current_session, get_current_task_id
 from .utils import Setter, check_dom_name_value, parse_file_size
 
-logger = logging.getLogger(__name__)
-
 TEXT = 'text'
 NUMBER = "number"
 FLOAT = "float"
@@ -100,12 +96,21 @@ RADIO = 'radio'
 SELECT = 'select'
 TEXTAREA = 'textarea'
 
+_INPUT_ALLOWED_TYPES = frozenset((TEXT, NUMBER, FLOAT, PASSWORD, URL, DATE, TIME, COLOR, DATETIME_LOCAL))
+# The input types that can get the auto focus in `input_group()` by default
+_AUTOFOCUS_TYPES = frozenset((TEXT, NUMBER, PASSWORD, SELECT, URL, FLOAT, DATE, TIME, DATETIME_LOCAL))
+
 __all__ = ['TEXT', 'NUMBER', 'FLOAT', 'PASSWORD', 'URL', 'DATE',
            'TIME', 'COLOR', 'DATETIME_LOCAL', 'input', 'textarea',
            'select', 'checkbox', 'radio', 'actions', 'file_upload',
            'slider', 'input_group', 'input_update']
 
 
+def _identity(d):
+    """The shared preprocess function of the input items that don't need to convert the submitted data"""
+    return d
+
+
 def _parse_args(kwargs, excludes=()):
     """parse the raw parameters that pass to input functions
 
@@ -114,10 +119,14 @@ def _parse_args(kwargs, excludes=()):
 
     :return:（spec，valid_func）
     """
+    # `kwargs` is the `locals()` of the caller, which may be re-synced from the frame (e.g. under a tracer),
+    # so build the spec in a new dict instead of modifying it in place
+    other_html_attrs = kwargs.get('other_html_attrs')
     kwargs = {k: v for k, v in kwargs.items() if v is not None and k not in excludes}
     check_dom_name_value(kwargs.get('name', ''), '`name`')
 
-    kwargs.update(kwargs.get('other_html_attrs', {}))
+    if other_html_attrs:
+        kwargs.update(other_html_attrs)
     kwargs.pop('other_html_attrs', None)
 
     if kwargs.get('validate'):
@@ -228,8 +237,7 @@ def input(label: str = '', type: str = TEXT, *, validate: Callable[[Any], Option
     item_spec, valid_func, onchange_func = _parse_args(locals(), excludes=('action',))
 
     # check input type
-    allowed_type = {TEXT, NUMBER, FLOAT, PASSWORD, URL, DATE, TIME, COLOR, DATETIME_LOCAL}
-    assert type in allowed_type, 'Input type not allowed.'
+    assert type in _INPUT_ALLOWED_TYPES, 'Input type not allowed.'
 
     value_setter = None
     if action:
@@ -296,7 +304,7 @@ def textarea(label: str = '', *, rows: int = 6, code: Union[bool, Dict] = None,
     item_spec, valid_func, onchange_func = _parse_args(locals())
     item_spec['type'] = TEXTAREA
 
-    return single_input(item_spec, valid_func, lambda d: d, onchange_func)
+    return single_input(item_spec, valid_func, _identity, onchange_func)
 
 
 def _parse_select_options(options):
@@ -305,14 +313,20 @@ def _parse_select_options(options):
     # {value:, label:, [selected:,] [disabled:]}
     # (value, label, [selected,] [disabled])
     # value (label same as value)
+    # A new dict is created for each option, since the result will be modified later (e.g. `_set_options_selected()`)
     opts_res = []
     for opt in options:
-        opt = copy.deepcopy(opt)
-        if isinstance(opt, Mapping):
-            assert 'value' in opt and 'label' in opt, 'options item must have value and label key'
-        elif isinstance(opt, (list, tuple)):
+        if isinstance(opt, (list, tuple)):
             assert len(opt) > 1 and len(opt) <= 4, 'options item format error'
-            opt = dict(zip(('label', 'value', 'selected', 'disabled'), opt))
+            if len(opt) == 2:
+                opt = {'label': opt[0], 'value': opt[1]}
+            elif len(opt) == 3:
+                opt = {'label': opt[0], 'value': opt[1], 'selected': opt[2]}
+            else:
+                opt = {'label': opt[0], 'value': opt[1], 'selected': opt[2], 'disabled': opt[3]}
+        elif isinstance(opt, Mapping):
+            assert 'value' in opt and 'label' in opt, 'options item must have value and label key'
+            opt = dict(opt)
         else:
             opt = dict(value=opt, label=opt)
         opts_res.append(opt)
@@ -376,7 +390,7 @@ def select(label: str = '', options: List[Union[Dict[str, Any], Tuple, List, str
         item_spec['options'] = _set_options_selected(item_spec['options'], value)
     item_spec['type'] = SELECT
 
-    return single_input(item_spec, valid_func=valid_func, preprocess_func=lambda d: d, onchange_func=onchange_func)
+    return single_input(item_spec, valid_func=valid_func, preprocess_func=_identity, onchange_func=onchange_func)
 
 
 def checkbox(label: str = '', options: List[Union[Dict[str, Any], Tuple, List, str]] = None, *, inline: bool = None, validate: Callable[[Any], Optional[str]] = None,
@@ -399,7 +413,7 @@ def checkbox(label: str = '', options: List[Union[Dict[str, Any], Tuple, List, s
         item_spec['options'] = _set_options_selected(item_spec['options'], value)
     item_spec['type'] = CHECKBOX
 
-    return single_input(item_spec, valid_func, lambda d: d, onchange_func)
+    return single_input(item_spec, valid_func, _identity, onchange_func)
 
 
 def radio(label: str = '', options: List[Union[Dict[str, Any], Tuple, List, str]] = None, *, inline: bool = None, validate: Callable[[Any], Optional[str]] = None,
@@ -431,7 +445,7 @@ def radio(label: str = '', options: List[Union[Dict[str, Any], Tuple, List, str]
         item_spec['options'][-1]['required'] = required
     item_spec['type'] = RADIO
 
-    return single_input(item_spec, valid_func, lambda d: d, onchange_func)
+    return single_input(item_spec, valid_func, _identity, onchange_func)
 
 
 def _parse_action_buttons(buttons):
@@ -448,14 +462,19 @@ def _parse_action_buttons(buttons):
     """
     act_res = []
     for act in buttons:
-        act = copy.deepcopy(act)
-        if isinstance(act, Mapping):
+        if isinstance(act, (list, tuple)):
+            assert len(act) in (2, 3, 4), 'actions item format error'
+            if len(act) == 2:
+                act = {'label': act[0], 'value': act[1]}
+            elif len(act) == 3:
+                act = {'label': act[0], 'value': act[1], 'type': act[2]}
+            else:
+                act = {'label': act[0], 'value': act[1], 'type': act[2], 'disabled': act[3]}
+        elif isinstance(act, Mapping):
             assert 'label' in act, 'actions item must have label key'
             assert 'value' in act or act.get('type', 'submit') != 'submit' or act.get('disabled'), \
                 'actions item must have value key for submit type'
-        elif isinstance(act, (list, tuple)):
-            assert len(act) in (2, 3, 4), 'actions item format error'
-            act = dict(zip(('label', 'value', 'type', 'disabled'), act))
+            act = dict(act)
         else:
             act = dict(value=act, label=act)
 
@@ -564,7 +583,7 @@ def actions(label: str = '', buttons: List[Union[Dict[str, Any], Tuple, List, st
     item_spec['type'] = 'actions'
     item_spec['buttons'] = _parse_action_buttons(buttons)
 
-    return single_input(item_spec, valid_func, lambda d: d, onchange_func)
+    return single_input(item_spec, valid_func, _identity, onchange_func)
 
 
 def file_upload(label: str = '', accept: Union[List, str] = None, name: str = None, placeholder: str = 'Choose file',
@@ -670,7 +689,7 @@ def slider(label: str = '', *, name: str = None, value: Union[int, float] = 0, m
     if item_spec['float']:
         item_spec['step'] = 'any'
 
-    return single_input(item_spec, valid_func, lambda d: d, onchange_func)
+    return single_input(item_spec, valid_func, _identity, onchange_func)
 
 
 def input_group(label: str = '', inputs: List = None, validate: Callable[[Dict], Optional[Tuple[str, str]]] = None, cancelable: bool = False):
@@ -717,6 +736,8 @@ def input_group(label: str = '', inputs: List = None, validate: Callable[[Dict],
     preprocess_funcs = {}
     item_valid_funcs = {}
     onchange_funcs = {}
+    has_auto_focus = False  # Whether `auto_focus` parameter is set in any input item
+    auto_focus_item = None  # The first input item which can get auto focus by default
     for single_input_return in inputs:
         input_kwargs = single_input_kwargs(single_input_return)
 
@@ -727,19 +748,21 @@ def input_group(label: str = '', inputs: List = None, validate: Callable[[Dict],
 
         input_name = input_kwargs['item_spec']['name']
         assert input_name, "`name` can not be empty!"
-        if input_name in preprocess_funcs:
+        if input_name in item_valid_funcs:
             raise ValueError('Duplicated input item name "%s" in same input group!' % input_name)
-        preprocess_funcs[input_name] = input_kwargs['preprocess_func']
+        if input_kwargs['preprocess_func'] is not _identity:  # `input_control()` skips the items not in it
+            preprocess_funcs[input_name] = input_kwargs['preprocess_func']
         item_valid_funcs[input_name] = input_kwargs['valid_func']
         onchange_funcs[input_name] = input_kwargs['onchange_func']
         spec_inputs.append(input_kwargs['item_spec'])
 
-    if all('auto_focus' not in i for i in spec_inputs):  # No `auto_focus` parameter is set for each input item
-        for i in spec_inputs:
-            text_inputs = {TEXT, NUMBER, PASSWORD, SELECT, URL, FLOAT, DATE, TIME, DATETIME_LOCAL}
-            if i.get('type') in text_inputs:
-                i['auto_focus'] = True
-                break
+        if 'auto_focus' in input_kwargs['item_spec']:
+            has_auto_focus = True
+        elif auto_focus_item is None and input_kwargs['item_spec'].get('type') in _AUTOFOCUS_TYPES:
+            auto_focus_item = input_kwargs['item_spec']
+
+    if not has_auto_focus and auto_focus_item is not None:
+        auto_focus_item['auto_focus'] = True
 
     spec = dict(label=label, inputs=spec_inputs, cancelable=cancelable)
     return input_control(spec, preprocess_funcs=preprocess_funcs,
@@ -212,21 +212,20 @@ def send_msg(cmd, spec=None, task_id=None):
 
 
 def single_input_kwargs(single_input_return):
-    try:
-        # 协程模式下，单项输入为协程对象，可以通过send(None)来获取传入单项输入的参数字典
-        # In the coroutine mode, the item of `inputs` is coroutine object.
-        # using `send(None)` to get the single input function's parameter dict.
-        single_input_return.send(None)
-    except StopIteration as e:  # This is in the coroutine mode
-        input_kwargs = e.args[0]
-    except AttributeError:  # This is in the thread mode
-        input_kwargs = single_input_return
-    else:
-        raise RuntimeError("Can't get kwargs from single input")
-    return input_kwargs
+    """Get the parameter dict from the return value of the input function called with ``name`` parameter.
+
+    Return ``None`` if the input function is not called with ``name`` parameter.
+    """
+    if isinstance(single_input_return, dict):
+        return single_input_return
+
+    if inspect.iscoroutine(single_input_return):
+        # In the coroutine mode, the input function without `name` parameter returns a coroutine object,
+        # close it to avoid the "coroutine was never awaited" warning.
+        single_input_return.close()
+    return None
 
 
-@chose_impl
 def single_input(item_spec, valid_func, preprocess_func, onchange_func):
     """
     Note: 鲁棒性在上层完成
@@ -236,13 +235,19 @@ def single_input(item_spec, valid_func, preprocess_func, onchange_func):
     :param onchange_func: Not None
     :param preprocess_func: Not None, 预处理函数，在收到用户提交的单项输入的原始数据后用于在校验前对数据进行预处理
     """
-    if item_spec.get('name') is None:  # single input
-        item_spec['name'] = 'data'
-    else:  # as input_group item
+    if item_spec.get('name') is not None:  # as input_group item
+        # Return the parameters directly in both thread and coroutine mode,
         # use `single_input_kwargs()` to get the returned value
         return dict(item_spec=item_spec, valid_func=valid_func,
                     preprocess_func=preprocess_func, onchange_func=onchange_func)
 
+    # single input
+    item_spec['name'] = 'data'
+    return _single_input(item_spec, valid_func, preprocess_func, onchange_func)
+
+
+@chose_impl
+def _single_input(item_spec, valid_func, preprocess_func, onchange_func):
     label = item_spec['label']
     name = item_spec['name']
     # todo 是否可以原地修改spec
@@ -266,7 +271,7 @@ def input_control(spec, preprocess_funcs, item_valid_funcs, onchange_funcs, form
     """
     发送input命令，监听事件，验证输入项，返回结果
     :param spec:
-    :param preprocess_funcs: keys 严格等于 spec中的name集合
+    :param preprocess_funcs: keys 为 spec中的name集合的子集, 不在其中的输入项不进行预处理
     :param item_valid_funcs: keys 严格等于 spec中的name集合
     :param onchange_funcs: keys 严格等于 spec中的name集合
     :param form_valid_funcs: can be ``None``
@@ -280,9 +285,10 @@ def input_control(spec, preprocess_funcs, item_valid_funcs, onchange_funcs, form
     return data
 
 
-def check_item(name, data, valid_func, preprocess_func):
+def check_item(name, data, valid_func, preprocess_func=None):
     try:
-        data = preprocess_func(data)
+        if preprocess_func is not None:
+            data = preprocess_func(data)
         error_msg = valid_func(data)
     except Exception as e:
         logger.warning('Get %r in valid_func for name:"%s"', e, name)
@@ -330,7 +336,7 @@ def input_event_handle(item_valid_funcs, form_valid_funcs, preprocess_funcs, onc
     :param item_valid_funcs: map(name -> valid_func)  valid_func 为 None 时，不进行验证
                         valid_func: callback(data) -> error_msg or None
     :param form_valid_funcs: callback(data) -> (name, error_msg) or None
-    :param preprocess_funcs: map(name -> process_func)
+    :param preprocess_funcs: map(name -> process_func)  name 不在其中时，不进行预处理
     :param onchange_funcs: map(name -> onchange_func)
     :return:
     """
@@ -342,7 +348,7 @@ def input_event_handle(item_valid_funcs, form_valid_funcs, preprocess_funcs, onc
             if input_event == 'blur':
                 onblur_name = event_data['name']
                 check_item(onblur_name, event_data['value'], item_valid_funcs[onblur_name],
-                           preprocess_funcs[onblur_name])
+                           preprocess_funcs.get(onblur_name))
             elif input_event == 'change':
                 trigger_onchange(event_data, onchange_funcs)
 
@@ -351,11 +357,14 @@ def input_event_handle(item_valid_funcs, form_valid_funcs, preprocess_funcs, onc
 
             # 调用输入项验证函数进行校验
             for name, valid_func in item_valid_funcs.items():
-                if not check_item(name, event_data[name], valid_func, preprocess_funcs[name]):
+                if not check_item(name, event_data[name], valid_func, preprocess_funcs.get(name)):
                     all_valid = False
 
             if all_valid:  # todo 减少preprocess_funcs[name]调用次数
-                data = {name: preprocess_funcs[name](val) for name, val in event_data.items()}
+                data = dict(event_data)
+                for name, preprocess_func in preprocess_funcs.items():
+                    if name in data:
+                        data[name] = preprocess_func(data[name])
                 # 调用表单验证函数进行校验
                 if form_valid_funcs:
                     v_res = form_valid_funcs(data)
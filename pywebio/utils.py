@@ -377,8 +377,6 @@ def strip_space(text, n):
 
 def check_dom_name_value(value, name='`name`'):
     """check the class name / id name of DOM element"""
-    allowed_chars = set(string.ascii_letters + string.digits + '_-')
-
-    if not all(i in allowed_chars for i in value):
+    if not _html_value_chars.issuperset(value):
         raise ValueError(name + " can only contain letters, digits, "
                                 "hyphens ('-') and underscore ('_')")
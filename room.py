@@ -1,54 +1,77 @@
-# -*- coding: utf-8 -*-
-"""
-Created on Fri Dec  2 21:16:57 2022
-
-@author: joyal
-"""
-import pywebio
-from pywebio import start_server
-from pywebio.input import *
-from pywebio.output import *
-import nest_asyncio
-nest_asyncio.apply()
-def roomrentcalc():
-    water_D = int(input("Dhana, Enter Number of water can "))
-    water_J = int(input("Joyal, Enter Number of water can "))
-    water_A = int(input("Asar, Enter Number of water can "))
-    water_T = int(input("Thiru, Enter Number of water can "))
-    water_S = int(input("Sathish, Enter Number of water can "))
-    petrol_S = int(input("Sathish, Enter total petrol amount "))
-    other_D = int(input("Dhana, Enter other expenses amount if any "))
-    other_J = int(input("Joyal, Enter other expenses amount if any "))
-    other_A = int(input("Asar, Enter other expenses amount if any "))
-    other_T = int(input("Thiru, Enter other expenses amount if any "))
-    other_S = int(input("Sathish, Enter other expenses amount if any"))
-    
-    amount_water_D = water_D * 30
-    amount_water_J = water_J * 30
-    amount_water_A = water_A * 30
-    amount_water_T = water_T * 30
-    amount_water_S = water_S * 30
-    
-    Total_water = (amount_water_D + amount_water_J + amount_water_A + amount_water_T + amount_water_S) / 5
-    
-    Total_petrol = (petrol_S) / 5
-    
-    Total_other = (other_D + other_J + other_A + other_T + other_S) / 5
-    
-    Total_Rent_D = Total_water + Total_petrol + Total_other + 2000 - amount_water_D - other_D
-    Total_Rent_J = Total_water + Total_petrol + Total_other + 2000 - amount_water_J - other_J
-    Total_Rent_A = Total_water + Total_petrol + Total_other + 2000 - amount_water_A - other_A
-    Total_Rent_T = Total_water + Total_petrol + Total_other + 2000 - amount_water_T - other_T
-    Total_Rent_S = Total_water + Total_petrol + Total_other + 2000 - amount_water_S - petrol_S - other_S
-    
-    Total = Total_Rent_D + Total_Rent_J + Total_Rent_A + Total_Rent_T + Total_Rent_S
-    
-    put_text("Total Rent amount for Dhana is",Total_Rent_D)
-    put_text("Total Rent amount for Joyal is",Total_Rent_J)
-    put_text("Total Rent amount for Asar is",Total_Rent_A)
-    put_text("Total Rent amount for Thiru is",Total_Rent_T)
-    put_text("Total Rent amount for Sathish is",Total_Rent_S)
-    put_text("Total =",Total)
-
-if __name__ == '__main__':
+# -*- coding: utf-8 -*-
+"""
+Created on Fri Dec  2 21:16:57 2022
+
+@author: joyal
+"""
+import logging
+from functools import wraps
+
+import numpy as np
+
+import pywebio
+from pywebio import start_server
+from pywebio.input import *
+from pywebio.output import *
+
+logger = logging.getLogger(__name__)
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback of `numba.njit()` when Numba is not installed, the decorated function runs as pure Python"""
+
+        def decorator(func):
+            warned = False
+
+            @wraps(func)
+            def inner(*func_args, **func_kwargs):
+                nonlocal warned
+                if not warned:
+                    warned = True
+                    logger.warning("numba not installed; using pure-Python %s()", func.__name__)
+                return func(*func_args, **func_kwargs)
+
+            return inner
+
+        if len(args) == 1 and not kwargs and callable(args[0]):  # used as `@njit`
+            return decorator(args[0])
+        return decorator
+
+
+ROOMMATES = ['Dhana', 'Joyal', 'Asar', 'Thiru', 'Sathish']  # Sathish pays the petrol, keep him last
+RENT = 2000
+WATER_CAN_PRICE = 30
+
+
+# Compile eagerly at import with an explicit signature, so no submission pays the JIT latency.
+# `nogil` lets the sessions running in different threads execute the kernel concurrently.
+@njit('float64[:](int64[:], int64[:], int64)', cache=True, nogil=True)
+def _compute_rents(water_cans, others, petrol):
+    amount_water = water_cans * WATER_CAN_PRICE
+    share = (amount_water.sum() + petrol + others.sum()) / len(water_cans)
+    rents = share + RENT - amount_water - others
+    rents[-1] -= petrol
+    return rents
+
+
+def roomrentcalc():
+    data = input_group("Room rent", [
+        *[input("%s, Enter Number of water can " % name, name='water_' + name, type=NUMBER, value=0, required=True)
+          for name in ROOMMATES],
+        input("Sathish, Enter total petrol amount ", name='petrol', type=NUMBER, value=0, required=True),
+        *[input("%s, Enter other expenses amount if any " % name, name='other_' + name, type=NUMBER, value=0, required=True)
+          for name in ROOMMATES],
+    ])
+    water = np.array([data['water_' + name] for name in ROOMMATES], dtype=np.int64)
+    others = np.array([data['other_' + name] for name in ROOMMATES], dtype=np.int64)
+
+    rents = _compute_rents(water, others, data['petrol'])
+
+    for name, rent in zip(ROOMMATES, rents):
+        put_text("Total Rent amount for %s is" % name, rent)
+    put_text("Total =", rents.sum())
+
+if __name__ == '__main__':
     start_server(roomrentcalc, debug=True, port=8042)
\ No newline at end of file